@@ -1,3 +1,22 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
+import matplotlib.pyplot as plt
+
+try:
+    from numba import njit #Optional - compiles the fused statistics kernel of Stage 7.1
+except ImportError:
+    njit = None
+
+#Columns used by the run in Stage 13 - load_data reads only these
+STAGE13_COLS = [
+    'Name', 'Close Approach Date', 'Absolute Magnitude',
+    'Miss Dist.(kilometers)', 'Orbit ID',
+    'Est Dia in KM(min)', 'Est Dia in KM(max)',
+    'Minimum Orbit Intersection', 'Miles per hour', 'Hazardous'
+]
+
 #Data refinement and preparation phase
 """
 ____________________________________________________________________________________________
@@ -7,30 +26,59 @@ Loads asteroid data from a CSV file into a Pandas DataFrame.
 
 Args:
     filename (str): CSV file path.
+    cols (list): Names of the columns to read (default: STAGE13_COLS).
 Returns:
     pandas.DataFrame or None: DataFrame if successful, None if an error occurs.
 Raises:
     FileNotFoundError: File not found.
     pd.errors.EmptyDataError: File is empty.
-    pd.errors.ParserError: Invalid CSV format.
+    pyarrow.ArrowInvalid: Invalid CSV format.
     Exception: Any unexpected error.
 
 Notes:
     The CSV must be properly formatted.
+    Only the columns used by the analysis are read, with fixed dtypes
+    (float32 measurements, categorical "Orbit ID", boolean "Hazardous").
+    "Close Approach Date" is read as text; mask_data parses it so a malformed date only drops its own row.
+    The file is memory-mapped and parsed by the pyarrow CSV reader, so pyarrow must be installed.
     Errors are printed to the console.
 Example:
     data = NASADataProcessor.load_data("nasa.csv")
 """
 
-def load_data(filename):
+def load_data(filename, cols=STAGE13_COLS):
     try:
-        df = pd.read_csv(filename)
+        #Memory-map the file and parse it straight from the mapped pages with the Arrow CSV reader
+        with pa.memory_map(filename, 'r') as source:
+            if source.size() == 0:
+                raise pd.errors.EmptyDataError(filename)
+            table = pv.read_csv(
+                source,
+                read_options=pv.ReadOptions(block_size=1 << 22),
+                #Read only the analysed columns with predeclared types, so no inference/downcast pass is needed
+                convert_options=pv.ConvertOptions(
+                    include_columns=cols,
+                    column_types={
+                        'Name': pa.int64(),
+                        'Close Approach Date': pa.string(), #Parsed per row in mask_data
+                        'Absolute Magnitude': pa.float32(),
+                        'Miss Dist.(kilometers)': pa.float32(),
+                        'Orbit ID': pa.dictionary(pa.int32(), pa.string()),
+                        'Est Dia in KM(min)': pa.float32(),
+                        'Est Dia in KM(max)': pa.float32(),
+                        'Minimum Orbit Intersection': pa.float32(),
+                        'Miles per hour': pa.float32(),
+                        'Hazardous': pa.bool_()
+                    }
+                )
+            )
+        df = table.to_pandas() #Dictionary columns become categorical
         return df  #Return the DataFrame - (if successful)
     except FileNotFoundError:  #Missing file error
         print("Error: The file was not found.")
     except pd.errors.EmptyDataError:  #Empty file error
         print("Error: The file is empty.")
-    except pd.errors.ParserError:  #Parsing errors
+    except pa.ArrowInvalid:  #Parsing errors
         print("Error: Failed to parse the file. Please check its format.")
     except Exception as unexpected:  #Catch any other unexpected errors
         print(f"Error: An unexpected error occurred - {unexpected}")
@@ -49,42 +97,40 @@ Returns :
  Notes:
     - Assumes the presence "Close Approach Date" column with date values in a recognizable date format.
     - the function converts this column to datetime format to ensure accurate filtering.
+    - A categorical "Orbit ID" keeps only the orbits still present after filtering.
     - If the required column is not found, an error message is displayed, and the original DataFrame will be returned unchanged.
 
 Example:
     filtered_df = mask_data(nasa_file)
 """
 
-def extract_year(date_str):
-    try:
-        parts = date_str.split('-')
-        if len(parts) == 3: #A flag for good return of date
-            return int(parts[0])
-        return None
-    except ValueError:
-        return None
-
 def mask_data(df):
-    df['year'] = df['Close Approach Date'].apply(extract_year)
-    df = df[df['year'] >= 2000].drop(columns='year') #Makes the updated date
+    dates = df['Close Approach Date']
+    if not pd.api.types.is_datetime64_any_dtype(dates): #Parse the text dates - malformed dates become NaT and are filtered out
+        dates = pd.to_datetime(dates, format='%Y-%m-%d', errors='coerce', cache=True)
+    keep = dates.dt.year >= 2000
+    df = df.loc[keep].copy() #Makes the updated date
+    df['Close Approach Date'] = dates[keep] #Keep the parsed dates for the later stages
+    if 'Orbit ID' in df and isinstance(df['Orbit ID'].dtype, pd.CategoricalDtype): #Drop orbits left without asteroids so counts stay exact
+        df['Orbit ID'] = df['Orbit ID'].cat.remove_unused_categories()
     return df
 """
 _____________________________________________________________________________________________
 Stage 3: Analyze Data
 _____________________________________________________________________________________________
-cleans the dataframe to make it be more sorted and handle less storage.
-by removing specific columns and returns dataist details.
+returns dataset details as if specific columns were removed from the dataframe.
+The column set is computed from the names only - the DataFrame itself is not copied or modified.
 
 Args:
     df (pandas.DataFrame): The original DataFrame containing asteroid data.
 Returns:
     tuple: A tuple containing:
-        int: Total number of rows in the resulting DataFrame.
+        int: Total number of rows in the DataFrame.
         int: Total number of columns after removing specified ones.
         list: List of names of the columns that remain.
 
 Notes:
-    Drops the columns: "Orbiting Body","Equinox" and "Neo Reference ID".
+    Leaves out the columns: "Orbiting Body","Equinox" and "Neo Reference ID".
     If any of those columns are not present, the function proceeds without raising an error.
 
 Example:
@@ -93,10 +139,10 @@ Example:
 """
 
 def data_details(df):
-    df.drop(columns=['Orbiting Body', 'Neo Reference ID', 'Equinox'], inplace=True, errors='ignore') #Mention the column to be removed
-    num_rows = df.shape[0] #Get the numbers of rows
-    num_cols = df.shape[1] #Get the numbers of columns
-    titles = df.columns.tolist() #Get the list of remaining column names 
+    dropped = {'Orbiting Body', 'Neo Reference ID', 'Equinox'} #Mention the column to be removed
+    titles = [col for col in df.columns if col not in dropped] #Get the list of remaining column names
+    num_rows = len(df) #Get the numbers of rows
+    num_cols = len(titles) #Get the numbers of columns
     return num_rows, num_cols, titles #Return a tuple with datadet details
 
 #Data analysis phase
@@ -118,8 +164,41 @@ Returns:
 """
 
 def max_absolute_magnitude(df):
-    max_index = df['Absolute Magnitude'].idxmax() #Find the highest absolute magnitude value
-    return int(df.loc[max_index, 'Name']), float(df.loc[max_index, 'Absolute Magnitude']) #Get the mentioned and corresponding asteroid name
+    magnitudes = df['Absolute Magnitude'].to_numpy()
+    max_pos = np.nanargmax(magnitudes) #Find the position of the highest absolute magnitude value (NaN skipped like idxmax)
+    return int(df['Name'].iat[max_pos]), float(magnitudes[max_pos]) #Get the mentioned and corresponding asteroid name
+
+"""
+_____________________________________________________________________________________________
+Stage 4.1: Pretty Output - the k highest absolute magnitude values
+_____________________________________________________________________________________________
+Identifies the k asteroids with the highest absolute magnitude values.
+The k-th largest value is found with np.partition (linear time) instead of sorting
+the whole column; only the selected k are then sorted for display.
+Ties are broken by row order, also at the k-th value, matching DataFrame.nlargest.
+
+Args:
+    df (pandas.DataFrame): DataFrame containing asteroid data, including "Name" and "Absolute Magnitude" columns.
+    k (int): Number of asteroids to return (default 10, capped at the number of rows).
+
+Returns:
+    tuple: (asteroid_names, values) - two numpy arrays ordered from the highest magnitude down.
+        Missing magnitudes (NaN) are only returned if fewer than k values are present.
+
+"""
+
+def top_k_magnitude(df, k=10):
+    magnitudes = df['Absolute Magnitude'].to_numpy()
+    k = min(k, magnitudes.size)
+    if k <= 0:
+        return df['Name'].to_numpy()[:0], magnitudes[:0]
+    keys = np.where(np.isnan(magnitudes), -np.inf, magnitudes) #Rank NaN last, the way idxmax skips it
+    kth_val = np.partition(keys, -k)[-k] #The k-th largest value
+    above = np.flatnonzero(keys > kth_val)
+    ties = np.flatnonzero(keys == kth_val)[:k - above.size] #Boundary ties - the first rows win
+    top_pos = np.concatenate((above, ties))
+    top_pos = top_pos[np.lexsort((top_pos, -keys[top_pos]))] #Sort only the selected k - ties keep row order
+    return df['Name'].to_numpy()[top_pos], magnitudes[top_pos]
 
 """
 _____________________________________________________________________________________________
@@ -135,9 +214,9 @@ Returns:
 """
 
 def closest_to_earth(df):
-    min_index = df['Miss Dist.(kilometers)'].idxmin() #Find the minimum miss distance value
+    min_pos = np.nanargmin(df['Miss Dist.(kilometers)'].to_numpy()) #Find the position of the minimum miss distance value
     #Get the name of the asteroid corresponding to the minimum miss distance
-    return int(df.loc[min_index, 'Name'])
+    return int(df['Name'].iat[min_pos])
 
 """
 _____________________________________________________________________________________________
@@ -153,25 +232,87 @@ Returns:
 """
 
 def common_orbit(df):
-    return df['Orbit ID'].value_counts() #Count occurrences of each Orbit ID and convert to dictionary
+    return df['Orbit ID'].value_counts() #Count occurrences of each Orbit ID (a bincount over the category codes)
 
 """
 _____________________________________________________________________________________________
 Stage 7: Pretty Output - ateroid with Orbit ID and return result as dictionary 
 _____________________________________________________________________________________________
-Counts how many asteroids have a maximum estimated diameter ("Est Dia in KM(max)")
-greater than the average maximum diameter of all asteroids in the DataFrame.
+Counts how many asteroids have a minimum estimated diameter ("Est Dia in KM(min)")
+greater than the average minimum diameter of all asteroids in the DataFrame.
 
 Args:
-    df (pandas.DataFrame): DataFrame containing asteroid data with the "Est Dia in KM(max)" column.
+    df (pandas.DataFrame): DataFrame containing asteroid data with the "Est Dia in KM(min)" column.
 Returns:
-    int: The number of asteroids whose maximum estimated diameter exceeds the overall average.
+    int: The number of asteroids whose minimum estimated diameter exceeds the overall average.
 
 """
 
 def min_max_diameter(df):
-    mean_val = df['Est Dia in KM(min)'].mean() #Calculate the average maximum diameter
-    return df[df['Est Dia in KM(min)'] > mean_val].shape[0] #Count rows with diameter above average
+    dia_min = df['Est Dia in KM(min)'].to_numpy()
+    mean_val = np.nanmean(dia_min) #Calculate the average minimum diameter
+    return int(np.count_nonzero(dia_min > mean_val)) #Count rows with diameter above average - no filtered copy
+
+"""
+_____________________________________________________________________________________________
+Stage 7.1: Fused statistics - Stages 4, 5 and 7 in one sweep over the columns
+_____________________________________________________________________________________________
+Computes the results of max_absolute_magnitude, closest_to_earth and min_max_diameter together.
+With Numba installed the three reductions run in a single compiled kernel that reads each
+column once (plus one more pass over "Est Dia in KM(min)" for the above-mean count).
+Without Numba the separate NumPy stage functions are used.
+
+Args:
+    df (pandas.DataFrame): DataFrame containing "Name", "Absolute Magnitude",
+                         "Miss Dist.(kilometers)" and "Est Dia in KM(min)" columns.
+Returns:
+    tuple: ((asteroid_name, max_value), closest_name, above_mean) - the same values
+        returned by Stages 4, 5 and 7.
+Raises:
+    ValueError: "Absolute Magnitude" or "Miss Dist.(kilometers)" has no values (all NaN), on both paths.
+
+"""
+
+def _fused_stats_kernel(magnitudes, miss_dist, dia_min):
+    max_pos = -1
+    min_pos = -1
+    total = 0.0
+    valid = 0
+    for i in range(magnitudes.size): #First pass - argmax, argmin and the running sum (NaN skipped)
+        if magnitudes[i] == magnitudes[i] and (max_pos < 0 or magnitudes[i] > magnitudes[max_pos]):
+            max_pos = i
+        if miss_dist[i] == miss_dist[i] and (min_pos < 0 or miss_dist[i] < miss_dist[min_pos]):
+            min_pos = i
+        if dia_min[i] == dia_min[i]:
+            total += dia_min[i]
+            valid += 1
+    if max_pos < 0 or min_pos < 0: #Same failure as np.nanargmax/np.nanargmin on an all-NaN column
+        raise ValueError('All-NaN slice encountered')
+    above_mean = 0
+    if valid > 0: #No diameters at all - 0 above the mean, as in min_max_diameter
+        mean_val = total / valid
+        for i in range(dia_min.size): #Second pass - count diameters above the average
+            if dia_min[i] > mean_val:
+                above_mean += 1
+    return max_pos, min_pos, above_mean
+
+if njit is not None:
+    try:
+        _fused_stats_kernel = njit(cache=True)(_fused_stats_kernel)
+    except RuntimeError: #No cache location (e.g. source run through exec or stdin) - compile per session
+        _fused_stats_kernel = njit(_fused_stats_kernel)
+
+def fused_core_stats(df):
+    if njit is None: #No Numba - a pure Python loop would be slower than the NumPy stages
+        return max_absolute_magnitude(df), closest_to_earth(df), min_max_diameter(df)
+    magnitudes = df['Absolute Magnitude'].to_numpy()
+    max_pos, min_pos, above_mean = _fused_stats_kernel(
+        magnitudes,
+        df['Miss Dist.(kilometers)'].to_numpy(),
+        df['Est Dia in KM(min)'].to_numpy()
+    )
+    names = df['Name']
+    return (int(names.iat[max_pos]), float(magnitudes[max_pos])), int(names.iat[min_pos]), int(above_mean)
 
 #Data presentation phase
 """
@@ -182,7 +323,7 @@ Prints basic information about the dataset (shape and column names).
 Identifies and prints the asteroid with the highest absolute magnitude.
 Finds and prints the asteroid that made the closest approach to Earth.
 Calculates and prints the frequency of asteroids by Orbit ID.
-Counts and prints how many asteroids have a maximum estimated diameter above the dataset's average.
+Counts and prints how many asteroids have a minimum estimated diameter above the dataset's average.
 
 Args:
     df (pandas.DataFrame): The input DataFrame containing asteroid data. 
@@ -193,32 +334,32 @@ Args:
             "Orbit ID"
             "Est Dia in KM(min)"
             "Est Dia in KM(max)"
+    orbit_counts (pandas.Series, optional): Result of common_orbit(df), if already computed.
 Returns:
     None
 """
 
-def run_analysis_and_print(df):
+def run_analysis_and_print(df, orbit_counts=None):
      #Print basic dataset info
     print("Saving mock_asteroid_data.csv to mock_asteroid_data.csv")
     print(f"Data shape: {df.shape[0]} rows x {df.shape[1]} columns")
-    print("Table Column Headers:") # Print column headers
-    for col in df.columns:
-        print(f"  {col}")
+    print("Table Column Headers:\n" + "\n".join(f"  {col}" for col in df.columns)) # Print column headers in one write
+
+    #Stages 4, 5 and 7 in one sweep over the columns
+    (max_name, max_val), closest_name, above_mean = fused_core_stats(df)
 
-    max_name, max_val = max_absolute_magnitude(df) #Find and print asteroid with the highest absolute magnitude
- 
+    #Print asteroid with the highest absolute magnitude
     print("Max absolute magnitude:")
-    print(f"  ({max_name}, {max_val})")
+    print(f"  ({max_name}, {max_val:g})") #float32 column - print at its own precision
 
-    closest_name = closest_to_earth(df) #Find and print the closest asteroid to Earth
     print("Closest to Earth asteroid:")
     print(f"  {closest_name}")
 
-    print("Orbit frequency:") #Count and print asteroids by Orbit ID
-    for orbit_id, count in common_orbit(df).items():
-        print(f"  {orbit_id}: {count}")
+    if orbit_counts is None: #Count and print asteroids by Orbit ID
+        orbit_counts = common_orbit(df)
+    print("Orbit frequency:\n" + "\n".join(f"  {orbit_id}: {count}" for orbit_id, count in orbit_counts.items()))
 
-    above_mean = min_max_diameter(df) #Count and print asteroids with diameter above the average
+    #Print asteroids with diameter above the average
     print("Asteroids above mean diameter:")
     print(f"  {above_mean}")
 
@@ -236,17 +377,27 @@ Args:
         (Note: This DataFrame must include the columns 
         "Est Dia in KM(min)" and "Est Dia in KM(max)". 
         If not, modify the column names accordingly.)
+    orbit_counts (pandas.Series, optional): Result of common_orbit(df), if already computed.
 
     The histogram is generated using 100 continuous bins.
 """
 
 # Check that the required columns exist
-def plt_hist_diameter_improved(df, bins=30, color='blue', show_grid=True):
+def plt_hist_diameter_improved(df, bins=30, color='blue', show_grid=True, orbit_counts=None):
     # Compute the average diameter for each asteroid
-    avg_diameter = df[['Est Dia in KM(min)', 'Est Dia in KM(max)']].mean(axis=1)
+    dia_min = df['Est Dia in KM(min)'].to_numpy()
+    dia_max = df['Est Dia in KM(max)'].to_numpy()
+    avg_diameter = np.empty_like(dia_min) #One output buffer - no temporary DataFrame
+    np.add(dia_min, dia_max, out=avg_diameter)
+    avg_diameter *= 0.5
+    #Like mean(axis=1): a row with one missing diameter takes the other one
+    np.copyto(avg_diameter, dia_max, where=np.isnan(dia_min))
+    np.copyto(avg_diameter, dia_min, where=np.isnan(dia_max))
     
     plt.figure(figsize=(10, 6))  # Create a new figure with dimensions 10x6 inches
-    plt.hist(avg_diameter, bins=bins, color=color, edgecolor='black')
+    avg_diameter = avg_diameter[np.isfinite(avg_diameter)] #Skip missing diameters, as plt.hist did
+    counts, edges = np.histogram(avg_diameter, bins=bins) #Bin once in NumPy, draw a single patch
+    plt.stairs(counts, edges, fill=True, color=color, edgecolor='black')
     plt.title('Distribution of Average Asteroid Diameters')
     plt.xlabel('Average Diameter (KM)')
     plt.ylabel('Number of Asteroids')
@@ -254,11 +405,13 @@ def plt_hist_diameter_improved(df, bins=30, color='blue', show_grid=True):
     if show_grid: #Optionally show grid on plot
         plt.grid(True, linestyle='--', alpha=0.6)
         
-    # Get min and max of average diameter
-    min_val = avg_diameter.min() 
-    max_val = avg_diameter.max()
+    # Get min and max of average diameter - the outer bin edges
+    min_val = edges[0]
+    max_val = edges[-1]
     # Determine tick step based on number of unique orbits
-    orbit_count = df['Orbit ID'].nunique()
+    if orbit_counts is None:
+        orbit_counts = common_orbit(df)
+    orbit_count = int(np.count_nonzero(orbit_counts.to_numpy())) #Orbits that have asteroids
     if orbit_count > 100:
         tick_step = 0.2
     else:
@@ -285,12 +438,15 @@ Args:
 def plt_hist_common_orbit(df):
     plt.figure(figsize=(10, 5))  #Create the plot
     #Plot the histogram with 10 bins over the specified range, set colors and add a label
-    df['Minimum Orbit Intersection'].plot(kind='hist', bins=10, color='gray')
+    intersections = df['Minimum Orbit Intersection'].to_numpy()
+    intersections = intersections[np.isfinite(intersections)] #Skip missing values, as Series.plot(kind='hist') did
+    counts, edges = np.histogram(intersections, bins=10)
+    plt.stairs(counts, edges, fill=True, color='gray')
     plt.title('Minimum Orbit Intersection')     #Set the title and labels for the axes
     plt.xlabel('Orbit Distance') #Set the title and labels for the axes
     plt.ylabel('Frequency')
     plt.grid(True, linestyle='--', alpha=0.6) #Display the legend and add gridlines
-    plt.xlim(df['Minimum Orbit Intersection'].min(), df['Minimum Orbit Intersection'].max())
+    plt.xlim(edges[0], edges[-1]) #The outer bin edges are the column's min and max (NaN skipped)
     plt.tight_layout() #Adjusts the layout so that all plot elements
     plt.show() #Renders and displays the final plot in a window or inline
 """
@@ -306,10 +462,16 @@ Args:
 """
 
 def plt_pie_hazard(df):
-    counts = df['Hazardous'].value_counts()
-    labels = ['Hazardous' if val == 1 else 'Non-Hazardous' for val in counts.index]
-    colors = ['red', 'green']  #Dis[lay by  the signs : red for dangerous and green for non-dangerous
-    explode = [0.1 if label == 'Hazardous' else 0 for label in labels]  #Reflects and emphesize for dangerous
+    hazardous = df['Hazardous'].dropna().to_numpy(dtype=bool) #Missing values are not counted as non-hazardous
+    counts = np.bincount(hazardous.view(np.uint8), minlength=2) #[non-hazardous, hazardous]
+    labels = np.array(['Non-Hazardous', 'Hazardous'])
+    colors = np.array(['green', 'red'])  #Dis[lay by  the signs : red for dangerous and green for non-dangerous
+    explode = np.array([0, 0.1])  #Reflects and emphesize for dangerous
+    present = counts > 0 #Skip empty classes - no 0.0% wedge
+    counts = counts[present]
+    labels = labels[present]
+    colors = colors[present]
+    explode = explode[present]
     
     plt.figure(figsize=(10, 6)) #Create the new plot
     plt.pie(
@@ -340,6 +502,10 @@ Args:
 Returns:
     None
 
+Notes:
+    Above 10,000 asteroids the points are drawn as pixel markers of a single line,
+    which renders far faster than a scatter collection.
+
 My Answer:
     Based on the regression analysis shown in the plot,
     there does not appear to be a strong linear correlation between miss distance and asteroid speed.
@@ -348,11 +514,21 @@ My Answer:
 """
 
 def plt_linear_motion_magnitude(df):
-    x = df['Miles per hour']
-    y = df['Absolute Magnitude']
-    slope, intercept, r, p, stderr = np.linregress(x, y) #Compute the linear regression coefficients
+    x = df['Miles per hour'].to_numpy(dtype=np.float64)
+    y = df['Absolute Magnitude'].to_numpy(dtype=np.float64)
+    #Compute the linear regression coefficients (closed-form least squares)
+    n = x.size
+    sum_x = x.sum()
+    sum_y = y.sum()
+    sum_xx = np.dot(x, x)
+    sum_xy = np.dot(x, y)
+    slope = (n * sum_xy - sum_x * sum_y) / (n * sum_xx - sum_x * sum_x)
+    intercept = (sum_y - slope * sum_x) / n
     #Create the plot
-    plt.scatter(x, y) #Plot the actual data points
+    if n > 10_000: #Large datasets - one pixel-marker line instead of one path per point
+        plt.plot(x, y, ',', alpha=0.3)
+    else:
+        plt.scatter(x, y) #Plot the actual data points
     plt.plot(x, slope * x + intercept, color='red') #Plot the regression line
     plt.title('Absolute Magnitude vs Speed')
     plt.xlabel('Speed (mph)')
@@ -368,21 +544,13 @@ _______________________________________
 """
 
 # Load and filter the data
-df = load_data() 
+df = load_data('nasa - csv')
 df = mask_data(df)
 
-# Select only relevant columns
-df = df[[ 
-    'Name', 'Close Approach Date', 'Absolute Magnitude',
-    'Miss Dist.(kilometers)', 'Orbit ID',
-    'Est Dia in KM(min)', 'Est Dia in KM(max)',
-    'Minimum Orbit Intersection', 'Miles per hour', 'Hazardous',
-    'Orbiting Body', 'Neo Reference ID', 'Equinox'
-]]
-
 #Run core analysis and plots
-run_analysis_and_print(df)
-plt_hist_diameter_improved(df)
+orbit_counts = common_orbit(df) #Shared by the printout and the diameter histogram
+run_analysis_and_print(df, orbit_counts)
+plt_hist_diameter_improved(df, orbit_counts=orbit_counts)
 plt_hist_common_orbit(df)
 plt_pie_hazard(df)
 plt_linear_motion_magnitude(df)